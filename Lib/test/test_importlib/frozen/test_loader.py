@@ -10,38 +10,45 @@
 import warnings
 
 
-@contextlib.contextmanager
-def deprecated():
-    with warnings.catch_warnings():
-        warnings.simplefilter('ignore', DeprecationWarning)
-        yield
+HELLO_REPR = "<module '__hello__' (frozen)>"
 
 
 @contextlib.contextmanager
-def fresh(name, *, oldapi=False):
+def fresh(name):
     with util.uncache(name):
-        with import_helper.frozen_modules():
-            with captured_stdout() as stdout:
-                if oldapi:
-                    with deprecated():
-                        yield stdout
-                else:
-                    yield stdout
+        with captured_stdout() as stdout:
+            yield stdout
+
+
+def _new_module(machinery, name):
+    """Return a new, unexecuted module with a frozen spec for *name*."""
+    spec = machinery.ModuleSpec(
+        name,
+        machinery.FrozenImporter,
+        origin='frozen',
+        is_package=machinery.FrozenImporter.is_package(name),
+    )
+    module = types.ModuleType(name)
+    module.__spec__ = spec
+    return module
+
+
+class FrozenModulesMixin:
 
+    """Force frozen modules to be used for the whole test class."""
 
-class ExecModuleTests(abc.LoaderTests):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._frozen_modules = import_helper.frozen_modules()
+        cls._frozen_modules.__enter__()
+        cls.addClassCleanup(cls._frozen_modules.__exit__, None, None, None)
+
+
+class ExecModuleTests(FrozenModulesMixin, abc.LoaderTests):
 
     def exec_module(self, name):
-        with import_helper.frozen_modules():
-            is_package = self.machinery.FrozenImporter.is_package(name)
-        spec = self.machinery.ModuleSpec(
-            name,
-            self.machinery.FrozenImporter,
-            origin='frozen',
-            is_package=is_package,
-        )
-        module = types.ModuleType(name)
-        module.__spec__ = spec
+        module = _new_module(self.machinery, name)
         assert not hasattr(module, 'initialized')
 
         with fresh(name) as stdout:
@@ -52,60 +59,38 @@ def exec_module(self, name):
         self.assertEqual(module.__spec__.origin, 'frozen')
         return module, stdout.getvalue()
 
-    def test_module(self):
-        name = '__hello__'
-        module, output = self.exec_module(name)
-        check = {'__name__': name}
-        for attr, value in check.items():
-            self.assertEqual(getattr(module, attr), value)
-        self.assertEqual(output, 'Hello world!\n')
-        self.assertTrue(hasattr(module, '__spec__'))
-
-    def test_package(self):
-        name = '__phello__'
-        module, output = self.exec_module(name)
-        check = {'__name__': name}
-        for attr, value in check.items():
-            attr_value = getattr(module, attr)
-            self.assertEqual(attr_value, value,
-                        'for {name}.{attr}, {given!r} != {expected!r}'.format(
-                                 name=name, attr=attr, given=attr_value,
-                                 expected=value))
-        self.assertEqual(output, 'Hello world!\n')
-
-    def test_lacking_parent(self):
-        name = '__phello__.spam'
-        with util.uncache('__phello__'):
-            module, output = self.exec_module(name)
-        check = {'__name__': name}
-        for attr, value in check.items():
-            attr_value = getattr(module, attr)
-            self.assertEqual(attr_value, value,
-                    'for {name}.{attr}, {given} != {expected!r}'.format(
-                             name=name, attr=attr, given=attr_value,
-                             expected=value))
-        self.assertEqual(output, 'Hello world!\n')
+    def test_modules(self):
+        # (name, modules that must not be imported beforehand)
+        for name, uncached in [('__hello__', ()),
+                               ('__phello__', ()),
+                               ('__phello__.spam', ('__phello__',)),
+                               ]:
+            with self.subTest(name=name):
+                with util.uncache(*uncached):
+                    module, output = self.exec_module(name)
+                self.assertEqual(module.__name__, name)
+                self.assertEqual(output, 'Hello world!\n')
+                self.assertTrue(hasattr(module, '__spec__'))
+
+    # Covered by test_modules().
+    test_module = test_package = test_lacking_parent = None
 
     def test_module_repr(self):
-        name = '__hello__'
-        module, output = self.exec_module(name)
-        with deprecated():
+        module, output = self.exec_module('__hello__')
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', DeprecationWarning)
             repr_str = self.machinery.FrozenImporter.module_repr(module)
-        self.assertEqual(repr_str,
-                         "<module '__hello__' (frozen)>")
+        self.assertEqual(repr_str, HELLO_REPR)
 
     def test_module_repr_indirect(self):
-        name = '__hello__'
-        module, output = self.exec_module(name)
-        self.assertEqual(repr(module),
-                         "<module '__hello__' (frozen)>")
+        module, output = self.exec_module('__hello__')
+        self.assertEqual(repr(module), HELLO_REPR)
 
     # No way to trigger an error in a frozen module.
     test_state_after_failure = None
 
     def test_unloadable(self):
-        with import_helper.frozen_modules():
-            assert self.machinery.FrozenImporter.find_spec('_not_real') is None
+        assert self.machinery.FrozenImporter.find_spec('_not_real') is None
         with self.assertRaises(ImportError) as cm:
             self.exec_module('_not_real')
         self.assertEqual(cm.exception.name, '_not_real')
@@ -116,56 +101,55 @@ def test_unloadable(self):
  ) = util.test_both(ExecModuleTests, machinery=machinery)
 
 
-class LoaderTests(abc.LoaderTests):
+class LoaderTests(FrozenModulesMixin, abc.LoaderTests):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Every test here uses the deprecated load_module(), module_repr()
+        # or find_module(); silence only those warnings, once per class.
+        cm = warnings.catch_warnings()
+        cm.__enter__()
+        cls.addClassCleanup(cm.__exit__, None, None, None)
+        warnings.filterwarnings(
+            'ignore',
+            r'(the load_module\(\) method'
+            r'|FrozenImporter\.(module_repr|find_module)\(\)) is deprecated',
+            DeprecationWarning)
 
     def load_module(self, name):
-        with fresh(name, oldapi=True) as stdout:
+        with fresh(name) as stdout:
             module = self.machinery.FrozenImporter.load_module(name)
         return module, stdout
 
-    def test_module(self):
-        module, stdout = self.load_module('__hello__')
-        check = {'__name__': '__hello__',
-                '__package__': '',
-                '__loader__': self.machinery.FrozenImporter,
-                }
-        for attr, value in check.items():
-            self.assertEqual(getattr(module, attr), value)
-        self.assertEqual(stdout.getvalue(), 'Hello world!\n')
-        self.assertFalse(hasattr(module, '__file__'))
-
-    def test_package(self):
-        module, stdout = self.load_module('__phello__')
-        check = {'__name__': '__phello__',
-                 '__package__': '__phello__',
-                 '__path__': [],
-                 '__loader__': self.machinery.FrozenImporter,
-                 }
-        for attr, value in check.items():
-            attr_value = getattr(module, attr)
-            self.assertEqual(attr_value, value,
-                             "for __phello__.%s, %r != %r" %
-                             (attr, attr_value, value))
-        self.assertEqual(stdout.getvalue(), 'Hello world!\n')
-        self.assertFalse(hasattr(module, '__file__'))
-
-    def test_lacking_parent(self):
-        with util.uncache('__phello__'):
-            module, stdout = self.load_module('__phello__.spam')
-        check = {'__name__': '__phello__.spam',
-                '__package__': '__phello__',
-                '__loader__': self.machinery.FrozenImporter,
-                }
-        for attr, value in check.items():
-            attr_value = getattr(module, attr)
-            self.assertEqual(attr_value, value,
-                             "for __phello__.spam.%s, %r != %r" %
-                             (attr, attr_value, value))
-        self.assertEqual(stdout.getvalue(), 'Hello world!\n')
-        self.assertFalse(hasattr(module, '__file__'))
+    def test_modules(self):
+        loader = self.machinery.FrozenImporter
+        for name, uncached, check in [
+                ('__hello__', (),
+                 {'__package__': '', '__loader__': loader}),
+                ('__phello__', (),
+                 {'__package__': '__phello__', '__path__': [],
+                  '__loader__': loader}),
+                ('__phello__.spam', ('__phello__',),
+                 {'__package__': '__phello__', '__loader__': loader}),
+                ]:
+            with self.subTest(name=name):
+                with util.uncache(*uncached):
+                    module, stdout = self.load_module(name)
+                self.assertEqual(module.__name__, name)
+                for attr, value in check.items():
+                    attr_value = getattr(module, attr)
+                    self.assertEqual(attr_value, value,
+                                     "for %s.%s, %r != %r" %
+                                     (name, attr, attr_value, value))
+                self.assertEqual(stdout.getvalue(), 'Hello world!\n')
+                self.assertFalse(hasattr(module, '__file__'))
+
+    # Covered by test_modules().
+    test_module = test_package = test_lacking_parent = None
 
     def test_module_reuse(self):
-        with fresh('__hello__', oldapi=True) as stdout:
+        with fresh('__hello__') as stdout:
             module1 = self.machinery.FrozenImporter.load_module('__hello__')
             module2 = self.machinery.FrozenImporter.load_module('__hello__')
         self.assertIs(module1, module2)
@@ -173,22 +157,19 @@ def test_module_reuse(self):
                          'Hello world!\nHello world!\n')
 
     def test_module_repr(self):
-        with fresh('__hello__', oldapi=True) as stdout:
+        with fresh('__hello__') as stdout:
             module = self.machinery.FrozenImporter.load_module('__hello__')
             repr_str = self.machinery.FrozenImporter.module_repr(module)
-        self.assertEqual(repr_str,
-                         "<module '__hello__' (frozen)>")
+        self.assertEqual(repr_str, HELLO_REPR)
 
     # No way to trigger an error in a frozen module.
     test_state_after_failure = None
 
     def test_unloadable(self):
-        with import_helper.frozen_modules():
-            with deprecated():
-                assert self.machinery.FrozenImporter.find_module('_not_real') is None
-            with self.assertRaises(ImportError) as cm:
-                self.load_module('_not_real')
-            self.assertEqual(cm.exception.name, '_not_real')
+        assert self.machinery.FrozenImporter.find_module('_not_real') is None
+        with self.assertRaises(ImportError) as cm:
+            self.load_module('_not_real')
+        self.assertEqual(cm.exception.name, '_not_real')
 
 
 (Frozen_LoaderTests,
@@ -196,7 +177,7 @@ def test_unloadable(self):
  ) = util.test_both(LoaderTests, machinery=machinery)
 
 
-class InspectLoaderTests:
+class InspectLoaderTests(FrozenModulesMixin):
 
     """Tests for the InspectLoader methods for FrozenImporter."""
 
@@ -204,17 +185,15 @@ def test_get_code(self):
         # Make sure that the code object is good.
         name = '__hello__'
         with captured_stdout() as stdout:
-            with import_helper.frozen_modules():
-                code = self.machinery.FrozenImporter.get_code(name)
-                mod = types.ModuleType(name)
-                exec(code, mod.__dict__)
+            code = self.machinery.FrozenImporter.get_code(name)
+            mod = types.ModuleType(name)
+            exec(code, mod.__dict__)
         self.assertTrue(hasattr(mod, 'initialized'))
         self.assertEqual(stdout.getvalue(), 'Hello world!\n')
 
     def test_get_source(self):
         # Should always return None.
-        with import_helper.frozen_modules():
-            result = self.machinery.FrozenImporter.get_source('__hello__')
+        result = self.machinery.FrozenImporter.get_source('__hello__')
         self.assertIsNone(result)
 
     def test_is_package(self):
@@ -222,8 +201,7 @@ def test_is_package(self):
         test_for = (('__hello__', False), ('__phello__', True),
                     ('__phello__.spam', False))
         for name, is_package in test_for:
-            with import_helper.frozen_modules():
-                result = self.machinery.FrozenImporter.is_package(name)
+            result = self.machinery.FrozenImporter.is_package(name)
             self.assertEqual(bool(result), is_package)
 
     def test_failure(self):
@@ -231,8 +209,7 @@ def test_failure(self):
         for meth_name in ('get_code', 'get_source', 'is_package'):
             method = getattr(self.machinery.FrozenImporter, meth_name)
             with self.assertRaises(ImportError) as cm:
-                with import_helper.frozen_modules():
-                    method('importlib')
+                method('importlib')
             self.assertEqual(cm.exception.name, 'importlib')
 
 (Frozen_ILTests,